@@ -1,3 +1,5 @@
+import os, sys, time
+LOAD_T = time.perf_counter()    # fallback origin for process_uptime()
 import pygame, random, math
 
 # ---------------------- Config ----------------------
@@ -69,6 +71,10 @@ TEAM_BALL = [
 
 N_TEAMS = 16
 
+# Resolved monospace font path is cached here between launches
+CACHE_DIR = os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+                         "paint-pong")
+
 # ----------------------------------------------------
 
 def clamp(v, lo, hi): return max(lo, min(hi, v))
@@ -79,10 +85,45 @@ def rand_dir():
     ang      = math.radians(base_deg + jitter)
     return math.cos(ang), math.sin(ang)
 
-def get_mono_font(size):
-    candidates = ["DejaVu Sans Mono","Menlo","Consolas","Courier New","Liberation Mono","Monaco"]
+def process_uptime():
+    """Seconds since this process started (Linux /proc), else since module load."""
+    try:
+        with open("/proc/self/stat") as f:
+            stat = f.read()
+        # starttime is field 22, in clock ticks since boot; skip past "(comm)"
+        start_ticks = int(stat.rsplit(")", 1)[1].split()[19])
+        return time.clock_gettime(time.CLOCK_BOOTTIME) - start_ticks / os.sysconf("SC_CLK_TCK")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return time.perf_counter() - LOAD_T
+
+def mono_font_path():
+    """
+    Path of the first installed monospace candidate, or None for pygame's default.
+    match_font scans every system font, so the answer (including "none found",
+    stored as an empty file) is cached in CACHE_DIR between launches.
+    """
+    cached = os.path.join(CACHE_DIR, "mono_font_path")
+    try:
+        with open(cached) as f:
+            path = f.read().strip()
+        if not path or os.path.isfile(path):
+            return path or None
+    except OSError:
+        pass
+    # "courier" last: it is what the old SysFont("courier") fallback looked up
+    candidates = ["DejaVu Sans Mono","Menlo","Consolas","Courier New","Liberation Mono","Monaco","courier"]
     path = pygame.font.match_font(candidates, bold=False, italic=False)
-    return pygame.font.Font(path, size) if path else pygame.font.SysFont("courier", size)
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(cached, "w") as f:
+            f.write(path or "")
+    except OSError:
+        pass
+    return path
+
+def get_mono_font(size):
+    # Font(None) is the same default SysFont falls back to when nothing matches
+    return pygame.font.Font(mono_font_path(), size)
 
 # --- Spark particles -------------------------------------------------
 def lighten(rgb, factor=1.5):
@@ -340,7 +381,9 @@ def draw_score_bar(screen, counts):
     pygame.draw.rect(screen, BORDER, (x, y, bar_w, bar_h), width=1, border_radius=4)
 
 def main():
-    pygame.init()
+    # display + font only; pygame.init() would also bring up audio, joystick, ...
+    pygame.display.init()
+    pygame.font.init()
     screen = pygame.display.set_mode((W, H))
     pygame.display.set_caption("Hex Paint Pong — 16 teams")
     clock = pygame.time.Clock()
@@ -354,6 +397,7 @@ def main():
 
     paused = False
     running = True
+    first_frame = True
 
     while running:
         dt = clock.tick(FPS) / 1000.0
@@ -408,6 +452,9 @@ def main():
         #screen.blit(hint, (12, H - 28))
 
         pygame.display.flip()
+        if first_frame:
+            first_frame = False
+            print(f"first frame {process_uptime()*1000:.0f} ms after process start", file=sys.stderr)
 
     pygame.quit()
 
@@ -1,3 +1,5 @@
+import os, sys, time
+LOAD_T = time.perf_counter()    # fallback origin for process_uptime()
 import pygame, random, math
 
 # ---------------------- Config ----------------------
@@ -37,6 +39,17 @@ def rand_dir():
     ang = random.uniform(0, 2*math.pi)
     return math.cos(ang), math.sin(ang)
 
+def process_uptime():
+    """Seconds since this process started (Linux /proc), else since module load."""
+    try:
+        with open("/proc/self/stat") as f:
+            stat = f.read()
+        # starttime is field 22, in clock ticks since boot; skip past "(comm)"
+        start_ticks = int(stat.rsplit(")", 1)[1].split()[19])
+        return time.clock_gettime(time.CLOCK_BOOTTIME) - start_ticks / os.sysconf("SC_CLK_TCK")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return time.perf_counter() - LOAD_T
+
 class Grid:
     # grid[y][x] holds a team id 0..3
     def __init__(self):
@@ -175,11 +188,14 @@ def draw_score_bar(screen, counts):
     pygame.draw.rect(screen, BORDER, (x, y, bar_w, bar_h), width=1, border_radius=4)
 
 def main():
-    pygame.init()
+    # display + font only; pygame.init() would also bring up audio, joystick, ...
+    pygame.display.init()
+    pygame.font.init()
     screen = pygame.display.set_mode((W, H))
     pygame.display.set_caption("Quad Paint Pong")
     clock = pygame.time.Clock()
-    font = pygame.font.SysFont(None, 22)
+    # Font(None) is the bundled default; SysFont(None) would scan system fonts first
+    font = pygame.font.Font(None, 22)
 
     grid = Grid()
 
@@ -192,6 +208,7 @@ def main():
 
     paused = False
     running = True
+    first_frame = True
 
     while running:
         dt = clock.tick(FPS) / 1000.0
@@ -231,6 +248,9 @@ def main():
         #screen.blit(hint, (12, H - 24))
 
         pygame.display.flip()
+        if first_frame:
+            first_frame = False
+            print(f"first frame {process_uptime()*1000:.0f} ms after process start", file=sys.stderr)
 
     pygame.quit()
 